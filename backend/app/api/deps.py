@@ -1,9 +1,71 @@
 """
 Dependency injection for FastAPI routes.
 """
-from typing import Annotated
-from fastapi import Depends
+from typing import Annotated, Any, Callable, Dict, TypeVar
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.session import get_async_session
+from app.schemas.message_schema import MessageRequest
+
+TModel = TypeVar("TModel", bound=BaseModel)
 
 SessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+
+
+def json_body(model: type[TModel]) -> Callable[[Request], Any]:
+    """
+    Dependency parsing the raw request body with `model.model_validate_json`.
+
+    pydantic-core parses and validates the bytes in one pass, skipping the
+    intermediate dict FastAPI builds with json.loads for a `Body(...)` param.
+    Errors are still reported as the usual 422 response.
+    """
+    async def _parse(request: Request) -> TModel:
+        raw = await request.body()
+        try:
+            return model.model_validate_json(raw)
+        except ValidationError as e:
+            errors = [
+                {**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)
+            ]
+            raise RequestValidationError(errors, body=raw) from e
+    return _parse
+
+
+_OPENAPI_REF_TEMPLATE = "#/components/schemas/{model}"
+_openapi_body_models: Dict[str, type[BaseModel]] = {}
+
+
+def json_body_openapi(model: type[BaseModel]) -> Dict[str, Any]:
+    """
+    `openapi_extra` documenting a body read through `json_body(model)`.
+
+    FastAPI never sees the model as a body param, so the schema is referenced
+    here and registered for `openapi_body_schemas` to add to the components.
+    """
+    _openapi_body_models[model.__name__] = model
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": _OPENAPI_REF_TEMPLATE.format(model=model.__name__)}
+                }
+            },
+        }
+    }
+
+
+def openapi_body_schemas() -> Dict[str, Any]:
+    """Component schemas (with their `$defs` hoisted) for models passed to `json_body_openapi`."""
+    schemas: Dict[str, Any] = {}
+    for name, model in _openapi_body_models.items():
+        schema = model.model_json_schema(ref_template=_OPENAPI_REF_TEMPLATE)
+        schemas.update(schema.pop("$defs", {}))
+        schemas[name] = schema
+    return schemas
+
+
+MessageRequestBody = Annotated[MessageRequest, Depends(json_body(MessageRequest))]
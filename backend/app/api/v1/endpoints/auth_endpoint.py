@@ -1,10 +1,12 @@
 """Authentication and user registration endpoints."""
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
 import uuid
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
@@ -25,6 +27,7 @@ from app.schemas.user_schema import (
     UserLoginResponse,
 )
 from app.utils.auth_utils import verify_identity_from_nextauth
+from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -40,7 +43,7 @@ async def register(
     Create a new user in the system.
     """
     statement = select(UserModel).where(
-        (UserModel.username == register_dto.username) | (UserModel.email == register_dto.email)
+        (UserModel.username == register_dto.username) | (func.lower(UserModel.email) == register_dto.email.lower())
     )
     result = await session.execute(statement)
     existing_user = result.scalars().first()
@@ -59,7 +62,8 @@ async def register(
         )
 
     # Hash the password before saving
-    hashed_password = get_password_hash(register_dto.password)
+    # bcrypt is deliberately slow (~0.2s) and releases the GIL: keep it off the event loop.
+    hashed_password = await run_in_threadpool(get_password_hash, register_dto.password)
 
     # Create UserModel instance from input data and hashed password
     user_data = register_dto.model_dump(exclude={"password"})
@@ -79,10 +83,11 @@ async def register(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Username already registered (database constraint).",
             ) from e
-        if "users_email_key" in error_detail: # Changed from elif due to no-else-raise
+        # Case-insensitive unique index on lower(email); catches case-variant races.
+        if "uq_users_email_lower" in error_detail:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail="Email already registered (database constraint).",
+                detail="Email already registered",
             ) from e
         # Other IntegrityError
         raise HTTPException(
@@ -107,7 +112,7 @@ async def login(
     """
     Login a user and return the user information along with an access token.
     """
-    statement = select(UserModel).where(UserModel.email == login_dto.email)
+    statement = select(UserModel).where(func.lower(UserModel.email) == login_dto.email.lower())
     result = await session.execute(statement)
     db_user = result.scalars().first()
 
@@ -123,7 +128,7 @@ async def login(
             detail="User has no password set (e.g., social login)",
         )
 
-    if not verify_password(login_dto.password, db_user.hashed_password):
+    if not await run_in_threadpool(verify_password, login_dto.password, db_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect password",
@@ -245,7 +250,7 @@ async def create_anonymous_token():
     
     refesh_token = {
         "token": "refresh" + str(uuid.uuid4()),
-        "expires_at": datetime.utcnow() + timedelta(days=20),
+        "expires_at": utc_now() + timedelta(days=20),
     }
     
     return {
@@ -4,16 +4,15 @@ from typing import AsyncGenerator, List, Optional, Union, Callable
 import uuid 
 
 import orjson
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession 
 
+from app.api.deps import MessageRequestBody, json_body_openapi
 from app.crud.chat_crud import ChatCRUD
-from app.library.providers.gemini import load_gemini_chat_models
-from app.library.providers.openai import load_openai_chat_models
 from app.models.message_model import MessageRole 
-from app.schemas.message_schema import MessageCreateRequest, MessageRequest, gen_message_id
+from app.schemas.message_schema import MessageCreateRequest, MessageRequest, MessageResponse, gen_message_id
 from app.database.session import get_async_ctx_session
 
 from langchain.schema import HumanMessage, AIMessage, SystemMessage
@@ -237,10 +236,12 @@ async def _generate_llm_stream(
         "Nhận tin nhắn của người dùng và lịch sử cuộc trò chuyện, "
         "truyền phát phản hồi của AI từng đoạn bằng Server-Sent Events (SSE)."
     ),
+    openapi_extra=json_body_openapi(MessageRequest),
 )
 async def chat_stream_endpoint(
+    http_request: Request,
     background_tasks: BackgroundTasks,
-    request: MessageRequest = Body(...),
+    request: MessageRequestBody,
     crud_for_request: ChatCRUD = Depends(ChatCRUD),
     current_user: Optional[UserLoggedIn] = Depends(get_optional_current_user), 
 ):
@@ -250,7 +251,7 @@ async def chat_stream_endpoint(
     logger.info(f"Received message for /chat/stream. Message: {request.message.content[:100]}...")
     user_id = current_user.id if current_user else DEFAULT_USER_ID
 
-    models = load_gemini_chat_models()
+    models = http_request.app.state.gemini
     llm_object = models.get("gemini-2.0-flash") # Đổi tên biến để tránh nhầm lẫn
 
     if not llm_object or not hasattr(llm_object, 'model') or not isinstance(llm_object.model, BaseChatModel):
@@ -346,9 +347,11 @@ async def chat_stream_endpoint(
         "Nhận tin nhắn của người dùng và lịch sử cuộc trò chuyện, "
         "truyền phát phản hồi của AI từng đoạn bằng Server-Sent Events (SSE)."
     ),
+    openapi_extra=json_body_openapi(MessageRequest),
 )
 async def chat_stream_endpoint2(
-    request: MessageRequest = Body(...),
+    http_request: Request,
+    request: MessageRequestBody,
     current_user: Optional[UserLoggedIn] = Depends(get_optional_current_user), 
 ):
     """
@@ -357,7 +360,7 @@ async def chat_stream_endpoint2(
     logger.info(f"Received message for /chat/stream. Message: {request.message.content[:100]}...")
     user_id = current_user.id if current_user else DEFAULT_USER_ID
 
-    models = load_openai_chat_models()
+    models = http_request.app.state.openai
     llm_object = models.get("gpt-4o-mini") # Đổi tên biến để tránh nhầm lẫn
 
     if not llm_object or not hasattr(llm_object, 'model') or not isinstance(llm_object.model, BaseChatModel):
@@ -464,7 +467,11 @@ async def add_message_to_thread_endpoint(
             detail="Could not add message to thread.",
         )
 
-@router.get("/threads/{thread_id}/messages", status_code=status.HTTP_200_OK)
+@router.get(
+    "/threads/{thread_id}/messages",
+    response_model=List[MessageResponse],
+    status_code=status.HTTP_200_OK,
+)
 async def get_thread_messages_endpoint(
     thread_id: str,
     crud: ChatCRUD = Depends(ChatCRUD),
@@ -1,5 +1,8 @@
 """Cấu hình logging cho ứng dụng."""
+import atexit
 import logging.config
+import logging.handlers
+import queue
 from pathlib import Path
 
 LOGS_DIR = Path("logs")
@@ -79,6 +82,35 @@ LOGGING_CONFIG = {
     },
 }
 
+_queue_listener: logging.handlers.QueueListener | None = None
+
+def _stop_queue_listener() -> None:
+    """Dừng QueueListener hiện tại (nếu có), xả hết record còn trong queue."""
+    global _queue_listener  # pylint: disable=global-statement
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+# Đăng ký một lần: gọi lại setup_logging() (reload, test) không tạo thêm hook.
+atexit.register(_stop_queue_listener)
+
 def setup_logging():
-    """Thiết lập cấu hình logging từ dictionary."""
+    """
+    Thiết lập cấu hình logging từ dictionary.
+
+    Handler của root logger (console + file) được chuyển sang một QueueListener.
+    QueueHandler.prepare() vẫn format record (kể cả traceback) ở thread gọi log;
+    chỉ phần I/O ghi stdout/file chạy ở thread riêng. Gọi lại hàm này sẽ dừng
+    listener cũ trước khi tạo listener mới.
+    """
+    global _queue_listener  # pylint: disable=global-statement
+    _stop_queue_listener()
     logging.config.dictConfig(LOGGING_CONFIG)
+
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    _queue_listener.start()
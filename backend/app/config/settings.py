@@ -1,7 +1,7 @@
 """Application configuration settings using Pydantic."""
 from functools import lru_cache
 import os
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
         GOOGLE_CLIENT_ID: Client ID for Google OAuth.
         MICROSOFT_TENANT_ID: Tenant ID for Microsoft Azure AD.
         MICROSOFT_CLIENT_ID: Client ID for Microsoft Azure AD.
+        ENV: Deployment environment; anything other than "prod" enables
+            development safeguards such as raising on lazy loads.
+        CORS_ORIGINS: Browser origins allowed to call the API with credentials,
+            as a JSON list in the environment.
     """
     DATABASE_URL: str
     GOOGLE_API_KEY: Optional[str] = None
@@ -30,6 +34,8 @@ class Settings(BaseSettings):
     MICROSOFT_TENANT_ID: str
     MICROSOFT_CLIENT_ID: str
     OPENAI_API_KEY: str
+    ENV: str = "dev"
+    CORS_ORIGINS: List[str] = ["http://localhost:3000"]
     class Config:
         """Pydantic model configuration."""
         env_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".env")
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any, Dict, Tuple, Union
 import uuid
 import bcrypt
@@ -16,7 +16,7 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta | Non
     if expires_delta:
         expire = utc_now() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
+        expire = utc_now() + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
@@ -8,6 +8,7 @@ import uuid
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from app.database.session import get_async_session
 from app.models.message_model import MessageModel, MessageRole
 from app.models.thread_model import ThreadModel
@@ -47,7 +48,11 @@ class ChatCRUD:
         """Get a thread by ID."""
         if not thread_id:
             return None
-        statement = select(ThreadModel).where(ThreadModel.id == thread_id) # Sửa: ThreadModel.id thay vì ThreadModel.thread_id
+        statement = (
+            select(ThreadModel)
+            .where(ThreadModel.id == thread_id) # Sửa: ThreadModel.id thay vì ThreadModel.thread_id
+            .options(raiseload(ThreadModel.messages)) # Chỉ cần thread, không tải messages
+        )
         result = await self.session.execute(statement)
         return result.scalars().first()
     
@@ -264,7 +269,8 @@ class ChatCRUD:
             .order_by(desc(ThreadModel.created_at))
             .offset(offset)
             .limit(limit)
-            # .options(selectinload(ThreadModel.messages)) # Ví dụ nếu muốn load cả messages (cẩn thận N+1)
+            # Cần quan hệ nào thì selectinload() tường minh; còn lại raise để bắt N+1
+            .options(raiseload("*"))
         )
         result = await self.session.execute(statement)
         return list(result.scalars().all())
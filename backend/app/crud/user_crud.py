@@ -11,6 +11,7 @@ from typing import Optional # Removed Any, Dict as they were unused
 
 from fastapi import Depends
 from pydantic import EmailStr # Part of Pydantic, typically considered third-party
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -79,7 +80,7 @@ class UserCRUD:
         """
         statement = (
             select(UserModel)
-            .where(UserModel.email == email)
+            .where(func.lower(UserModel.email) == email.lower())
             .options(selectinload(UserModel.linked_accounts))
         )
         results = await self.session.execute(statement)
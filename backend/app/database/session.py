@@ -2,13 +2,17 @@
 """
 Database session management for async operations.
 """
+import logging
 from typing import AsyncGenerator
 from fastapi.concurrency import asynccontextmanager
 from sqlalchemy import AsyncAdaptedQueuePool
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
 # Database URLs
 DATABASE_URL = settings.DATABASE_URL
 ASYNC_DATABASE_URL = settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
@@ -20,10 +24,16 @@ async_engine = create_async_engine(
     echo=True,
     future=True,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    # Recycle below typical pgbouncer / cloud LB idle timeouts.
+    pool_recycle=1800,
+    pool_size=20,
+    max_overflow=10,
     poolclass=AsyncAdaptedQueuePool,
     connect_args={
         # "ssl": False, 
+        # asyncpg prepared statements per connection (SQLAlchemy default: 100);
+        # the chat path repeats a handful of statements on every turn.
+        "prepared_statement_cache_size": 256,
     }
 )
 
@@ -35,6 +45,20 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+async def warm_up_engine() -> None:
+    """Open one pooled connection so the first request does not pay for the connect."""
+    try:
+        async with async_engine.connect():
+            pass
+    except (OSError, SQLAlchemyError):
+        logger.exception("Could not warm up the database connection pool")
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections."""
+    await async_engine.dispose()
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get an AsyncSession."""
     async with AsyncSessionLocal() as session:
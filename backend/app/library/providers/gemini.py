@@ -30,6 +30,8 @@ safety_settings = {
     HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
 }
 
+_COMMON_KWARGS = {"temperature": 0.7, "convert_system_message_to_human": True}
+
 def load_gemini_chat_models() -> Dict[str, ChatModel]:
     """
     Load Gemini chat models from the predefined list.
@@ -52,9 +54,8 @@ def load_gemini_chat_models() -> Dict[str, ChatModel]:
                 displayName=model.displayName,
                 model=ChatGoogleGenerativeAI(
                     api_key=geminiApiKey,
-                    convert_system_message_to_human=True,
                     model=model.key,
-                    temperature=0.7,
+                    **_COMMON_KWARGS,
                 )
             )
             
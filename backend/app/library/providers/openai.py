@@ -20,6 +20,8 @@ OPENAI_CHAT_MODELS = OpenAIChatModels(models=[
     OpenAIChatModel(displayName="GPT 4.1", key="gpt-4.1"),
 ])
 
+_COMMON_KWARGS = {"temperature": 0.7}
+
 def load_openai_chat_models() -> Dict[str, ChatModel]:
     """
     Load OpenAI chat models from the predefined list.
@@ -33,6 +35,7 @@ def load_openai_chat_models() -> Dict[str, ChatModel]:
     
     try:
         chat_models : Dict[str, ChatModel] = {}
+        secret = SecretStr(openaiApiKey)
         
         for model in OPENAI_CHAT_MODELS.models:
             if model.key in chat_models:
@@ -40,9 +43,9 @@ def load_openai_chat_models() -> Dict[str, ChatModel]:
             chat_model = ChatModel(
                 displayName=model.displayName,
                 model=ChatOpenAI(
-                    api_key=SecretStr(openaiApiKey),
-                    temperature=0.7,
+                    api_key=secret,
                     model=model.key,
+                    **_COMMON_KWARGS,
                 )
             )
             chat_models[model.key] = chat_model
@@ -1,24 +1,48 @@
 import asyncio
-from typing import Optional, List, Dict, Any
+import hashlib
+from functools import lru_cache, partial
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from urllib.parse import urlencode
 import aiohttp
+from cachetools import TTLCache
+import orjson
 from fastapi import HTTPException
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# aiohttp decodes gzip/deflate natively; "br" would need the optional brotli package
+_DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "search-gpt/1.0",
+}
+
+def _orjson_dumps(obj: Any) -> str:
+    """JSON serializer for outgoing request bodies"""
+    return orjson.dumps(obj).decode()
+
+@dataclass(frozen=True, slots=True)
 class SearxngSearchOptions:
-    """Search options for SearXNG API"""
-    categories: Optional[List[str]] = None
-    engines: Optional[List[str]] = None
+    """Search options for SearXNG API (immutable, so it can key the params cache)"""
+    categories: Optional[Tuple[str, ...]] = None
+    engines: Optional[Tuple[str, ...]] = None
     language: Optional[str] = None
     pageno: Optional[int] = None
     time_range: Optional[str] = None  # day, week, month, year
     safesearch: Optional[int] = None  # 0=off, 1=moderate, 2=strict
 
-@dataclass
+    def __post_init__(self) -> None:
+        # Callers may still pass lists; coerce so the options stay hashable
+        # for the lru_cache on _serialize_options.
+        for name in ('categories', 'engines'):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, (value,))
+            elif value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+@dataclass(frozen=True, slots=True)
 class SearxngSearchResult:
     """Single search result from SearXNG"""
     title: str
@@ -33,41 +57,91 @@ class SearxngSearchResult:
     score: Optional[float] = None
     category: Optional[str] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearxngResponse:
     """Complete response from SearXNG API"""
     results: List[SearxngSearchResult]
     suggestions: List[str]
     query: str
     number_of_results: int
-    
+
+@dataclass(frozen=True, slots=True)
+class SearxngSearchOutcome:
+    """Per-query result of a batch search: either a response or the error it raised"""
+    query: str
+    response: Optional[SearxngResponse] = None
+    error: Optional[HTTPException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether this query succeeded"""
+        return self.error is None
+
+@lru_cache(maxsize=128)
+def _serialize_options(options: SearxngSearchOptions) -> Tuple[Tuple[str, str], ...]:
+    """Serialize search options to query param pairs, once per distinct options value"""
+    pairs: List[Tuple[str, str]] = []
+    if options.categories:
+        pairs.append(('categories', ','.join(options.categories)))
+    if options.engines:
+        pairs.append(('engines', ','.join(options.engines)))
+    if options.language:
+        pairs.append(('language', options.language))
+    if options.pageno is not None:
+        pairs.append(('pageno', str(options.pageno)))
+    if options.time_range:
+        pairs.append(('time_range', options.time_range))
+    if options.safesearch is not None:
+        pairs.append(('safesearch', str(options.safesearch)))
+    return tuple(pairs)
+
 class SearxngClient:
     """Async SearXNG client optimized for FastAPI"""
     
-    def __init__(self, base_url: str, timeout: int = 30):
+    __slots__ = ("base_url", "timeout", "_session", "_inflight", "_recent")
+    
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         self.base_url = base_url.rstrip('/')
         self.timeout = aiohttp.ClientTimeout(total=timeout)
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        # Searches currently running, keyed by _request_key, shared by duplicate callers
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+        # Recent successful responses, same key; repeated queries skip the upstream call
+        self._recent: TTLCache = TTLCache(maxsize=1024, ttl=60)
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self._session = aiohttp.ClientSession(timeout=self.timeout)
+        await self.open()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self._session:
-            await self._session.close()
+        await self.close()
     
     @property
-    def session(self) -> aiohttp.ClientSession:
-        """Get or create session"""
+    def is_open(self) -> bool:
+        """Whether the client currently holds an HTTP session"""
+        return self._session is not None
+    
+    async def open(self):
+        """Create the HTTP session if one was not injected"""
         if self._session is None:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
-        return self._session
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                headers=_DEFAULT_HEADERS,
+                auto_decompress=True,
+                json_serialize=_orjson_dumps,
+            )
     
     async def close(self):
         """Close the HTTP session"""
+        for task in list(self._inflight.values()):
+            task.cancel()
         if self._session:
             await self._session.close()
             self._session = None
@@ -80,18 +154,7 @@ class SearxngClient:
         }
         
         if options:
-            if options.categories:
-                params['categories'] = ','.join(options.categories)
-            if options.engines:
-                params['engines'] = ','.join(options.engines)
-            if options.language:
-                params['language'] = options.language
-            if options.pageno is not None:
-                params['pageno'] = str(options.pageno)
-            if options.time_range:
-                params['time_range'] = options.time_range
-            if options.safesearch is not None:
-                params['safesearch'] = str(options.safesearch)
+            params.update(_serialize_options(options))
         
         return params
     
@@ -128,15 +191,66 @@ class SearxngClient:
             
         Raises:
             HTTPException: If API request fails
+            RuntimeError: If the client has no open session
         """
         if not query.strip():
             raise HTTPException(status_code=400, detail="Query cannot be empty")
         
+        if self._session is None:
+            raise RuntimeError(
+                "SearxngClient not initialized; use as async ctx manager or DI-inject session"
+            )
+        
         params = self._build_search_params(query, options)
+        key = self._request_key(params)
+        
+        cached = self._recent.get(key)
+        if cached is not None:
+            return cached
+        
+        # The upstream request runs as its own task shared by every duplicate
+        # caller; asyncio.wait doesn't cancel it when one caller is cancelled.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._do_search(query, params))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._finish_search, key))
+        await asyncio.wait((task,))
+        
+        if task.cancelled():  # only when the client itself is shut down
+            raise asyncio.CancelledError()
+        exc = task.exception()
+        if exc is None:
+            return task.result()
+        if isinstance(exc, HTTPException):
+            # Fresh instance per caller: re-raising the shared one from several
+            # tasks would keep growing its __traceback__.
+            raise HTTPException(
+                status_code=exc.status_code, detail=exc.detail, headers=exc.headers
+            ) from exc
+        raise exc
+    
+    def _finish_search(self, key: bytes, task: asyncio.Task) -> None:
+        """Drop a finished search from the in-flight map; cache it if it succeeded"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        if task.exception() is None:  # also marks a failure retrieved when nobody waited
+            self._recent[key] = task.result()
+    
+    @staticmethod
+    def _request_key(params: Dict[str, str]) -> bytes:
+        """Stable digest identifying identical search requests"""
+        raw = '\x1f'.join(f"{k}={v}" for k, v in sorted(params.items()))
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+    
+    async def _do_search(self, query: str, params: Dict[str, str]) -> SearxngResponse:
+        """Send the search request to SearXNG and parse the response"""
         search_url = f"{self.base_url}/search"
         
         try:
-            async with self.session.get(search_url, params=params) as response:
+            async with self._session.get(search_url, params=params) as response:
                 if response.status != 200:
                     logger.error(f"SearXNG API error: {response.status}")
                     raise HTTPException(
@@ -172,6 +286,43 @@ class SearxngClient:
                 detail="Internal server error during search"
             )
 
+    async def _search_outcome(
+        self,
+        query: str,
+        options: Optional[SearxngSearchOptions]
+    ) -> SearxngSearchOutcome:
+        """Run one search of a batch, turning its HTTP failure into an outcome"""
+        try:
+            return SearxngSearchOutcome(query=query, response=await self.search(query, options))
+        except HTTPException as e:
+            return SearxngSearchOutcome(query=query, error=e)
+    
+    async def search_many(
+        self,
+        queries: List[str],
+        options: Optional[SearxngSearchOptions] = None,
+        timeout: float = 30
+    ) -> List[SearxngSearchOutcome]:
+        """
+        Perform several searches concurrently
+        
+        Args:
+            queries: Search query strings
+            options: Search options shared by every query
+            timeout: Deadline in seconds for the whole batch
+            
+        Returns:
+            One SearxngSearchOutcome per query, in input order. A query that
+            failed with an HTTP error carries it in ``error``.
+            
+        Raises:
+            TimeoutError: If the batch does not finish within ``timeout``;
+                the searches still running are cancelled
+        """
+        async with asyncio.timeout(timeout), asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._search_outcome(q, options)) for q in queries]
+        return [t.result() for t in tasks]
+
 # Singleton instance for reuse across FastAPI app
 _searxng_client: Optional[SearxngClient] = None
 
@@ -207,4 +358,6 @@ async def search_searxng(
         Search response with results
     """
     client = get_searxng_client(base_url)
+    if not client.is_open:
+        await client.open()
     return await client.search(query, options)
\ No newline at end of file
@@ -2,8 +2,15 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+from app.api.deps import openapi_body_schemas
 from app.api.v1.router import api_router_v1
 from app.config.logging_config import setup_logging
+from app.config.settings import settings
+from app.database.session import dispose_engine, warm_up_engine
+from app.library.providers.gemini import load_gemini_chat_models
+from app.library.providers.openai import load_openai_chat_models
+from app.library.search_engine.searxng import cleanup_searxng_client
+from app.utils.auth_utils import close_http_client
 setup_logging()
 
 logger = logging.getLogger(__name__)
@@ -20,11 +27,35 @@ def create_application() -> FastAPI:
     # Add CORS middleware
     application.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        # Explicit origins: "*" with credentials makes Starlette echo any Origin back.
+        allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
+        allow_methods=["GET", "POST", "OPTIONS"],
         allow_headers=["*"],
     )
+
+    @application.on_event("startup")
+    async def _warmup() -> None:
+        """Build the LLM model adapters once so requests never pay for it."""
+        try:
+            application.state.gemini = load_gemini_chat_models()
+        except ValueError:
+            logger.exception("Could not load Gemini chat models at startup")
+            application.state.gemini = {}
+        try:
+            application.state.openai = load_openai_chat_models()
+        except ValueError:
+            logger.exception("Could not load OpenAI chat models at startup")
+            application.state.openai = {}
+        await warm_up_engine()
+
+    @application.on_event("shutdown")
+    async def _shutdown() -> None:
+        """Release pooled database, IdP HTTP and SearXNG connections."""
+        await dispose_engine()
+        await close_http_client()
+        await cleanup_searxng_client()
+
     # Health check endpoint
     @application.get("/health", tags=["health"])
     async def health() -> dict:
@@ -38,6 +69,19 @@ def create_application() -> FastAPI:
         return {"message": "Welcome to the Gemini Chat API!"}    
      # Include API router
     application.include_router(api_router_v1, prefix="/v1")
+
+    default_openapi = application.openapi
+
+    def openapi() -> dict:
+        """Default schema plus the components of bodies parsed by `json_body`."""
+        if application.openapi_schema is None:
+            schema = default_openapi()
+            components = schema.setdefault("components", {}).setdefault("schemas", {})
+            for name, body_schema in openapi_body_schemas().items():
+                components.setdefault(name, body_schema)
+        return application.openapi_schema
+
+    application.openapi = openapi
     return application
 
 app = create_application()
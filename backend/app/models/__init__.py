@@ -3,3 +3,4 @@ from .user_model import UserModel, LinkedAccountModel
 from .thread_model import ThreadModel
 from .message_model import MessageModel
 
+__all__ = ["UserModel", "LinkedAccountModel", "ThreadModel", "MessageModel"]
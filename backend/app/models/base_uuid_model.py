@@ -3,18 +3,26 @@
 BaseUUIDModel
 This module defines a base model class for SQLModel that uses UUIDs as primary keys.
 """
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
-from sqlmodel import SQLModel, Field
+from sqlalchemy import func, text
+from sqlmodel import DateTime, SQLModel, Field
 
 class BaseUUIDModel(SQLModel):
-    id: UUID = Field(
-        default_factory=uuid4,
+    id: UUID | None = Field(
+        default=None,
         primary_key=True,
         index=True,
         nullable=False,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
     )
     updated_at: datetime | None = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow}
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
-    created_at: datetime | None = Field(default_factory=datetime.utcnow)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from app.config.gemini_settings import DEFAULT_SYSTEM_PROMPT
 
@@ -23,7 +23,9 @@ class Message(BaseModel):
     """
 
     role: str
-    content: str | List[FileData]
+    # No shared tag to discriminate on; try the cheap `str` branch first
+    # instead of smart mode validating against both variants.
+    content: str | List[FileData] = Field(union_mode="left_to_right")
 
 
 class LastUserMessage(BaseModel):
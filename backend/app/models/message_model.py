@@ -1,12 +1,16 @@
 import uuid
 from pydantic import BaseModel
-from sqlmodel import  Column, DateTime, SQLModel, Field, String, Text
-from typing import Any, ClassVar, Dict, List, Optional
+from sqlmodel import  Column, DateTime, Relationship, SQLModel, Field, String, Text
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
 from datetime import datetime
 from app.schemas.thread_schema import  ContentMetadata
-from app.utils.datetime_utils import utc_now
+from app.utils.orm_utils import RELATIONSHIP_LAZY
+from app.utils.uuid_utils import uuid7
 from enum import Enum
-from sqlalchemy import types
+from sqlalchemy import BigInteger, func, types
+
+if TYPE_CHECKING:
+    from app.models.thread_model import ThreadModel
 
 class MessageRole(str, Enum):
     USER = "user"
@@ -28,9 +32,11 @@ class ContentMetadataType(types.TypeDecorator):
 
 class MessageBase(SQLModel):
     
-    created_at: datetime = Field(
-        default_factory=utc_now,
-        sa_column=Column(DateTime(timezone=True), index=True)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), index=True, server_default=func.now(), nullable=False
+        )
     )
     
     role: MessageRole = Field(
@@ -46,9 +52,12 @@ class MessageBase(SQLModel):
     
     created_by: Optional[str] = Field(default=None, index=True)
     
-    updated_at: datetime = Field(
-        default_factory=utc_now,
-        sa_column=Column(DateTime(timezone=True), index=True)
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), index=True,
+            server_default=func.now(), onupdate=func.now(), nullable=False
+        )
     )
     
     updated_by: Optional[str] = Field(default=None, index=False)
@@ -66,4 +75,15 @@ class MessageBase(SQLModel):
 
 class MessageModel(MessageBase, table=True):
     __tablename__: ClassVar[str] = "messages" 
-    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
\ No newline at end of file
+    # Internal surrogate key; FKs and joins use this narrow bigint.
+    id: Optional[int] = Field(default=None, primary_key=True, sa_type=BigInteger)
+    # Stable public identifier exposed through the API.
+    public_id: uuid.UUID = Field(default_factory=uuid7, unique=True, index=True)
+
+    thread: Optional["ThreadModel"] = Relationship(
+        back_populates="messages",
+        sa_relationship_kwargs={
+            "lazy": RELATIONSHIP_LAZY,
+            "primaryjoin": "ThreadModel.id == foreign(MessageModel.thread_id)",
+        },
+    )
\ No newline at end of file
@@ -1,23 +1,32 @@
 # pylint: disable=missing-module-docstring
-from typing import Any, ClassVar, Dict, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
 from datetime import datetime
 import uuid
-from sqlmodel import JSON, SQLModel, Field, Column, DateTime
+from sqlalchemy import Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import SQLModel, Field, Column, DateTime, Relationship
 
 from app.utils.datetime_utils import utc_now
+from app.utils.orm_utils import RELATIONSHIP_LAZY
+from app.utils.uuid_utils import uuid7
+
+if TYPE_CHECKING:
+    from app.models.message_model import MessageModel
 
 class ThreadBase(SQLModel):
+    # Free text: a B-tree cannot serve ILIKE '%x%'. If title search is added,
+    # index it with pg_trgm (GIN, gin_trgm_ops) rather than index=True.
     title: str = Field(default=None, index=False)
     
     created_at: datetime = Field(
         default_factory=utc_now,
-        sa_column=Column(DateTime(timezone=True), index=True)
+        sa_column=Column(DateTime(timezone=True))
     )
-    created_by: Optional[str] = Field(default=None, index=True)
+    created_by: Optional[str] = Field(default=None)
     
     updated_at: datetime = Field(
         default_factory=utc_now,
-        sa_column=Column(DateTime(timezone=True), index=True)
+        sa_column=Column(DateTime(timezone=True))
     )
     
     last_message_at: datetime = Field(
@@ -25,16 +34,38 @@ class ThreadBase(SQLModel):
         sa_column=Column(DateTime(timezone=True), index=True)
     )
 
-    is_archived: bool = Field(default=False, index=True)
+    is_archived: bool = Field(default=False)
     
-    workspace_id: Optional[str] = Field(default=None, index=True)
+    workspace_id: Optional[str] = Field(default=None)
     
     thread_metadata: Optional[Dict[str, Any]] = Field(
         default=None,
-        sa_column=Column(JSON), # Giữ nguyên cho kiểu JSON
+        sa_column=Column(JSONB), # JSONB: lưu dạng nhị phân, không parse lại mỗi lần đọc
         description="Meta data as JSON, may be NULL."
     )
 
 class ThreadModel(ThreadBase, table=True):
     __tablename__: ClassVar[str] = "threads" 
-    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
\ No newline at end of file
+    __table_args__ = (
+        # Thread list per user: WHERE created_by = ? ORDER BY created_at DESC
+        Index("ix_threads_created_by_recent", "created_by", text("created_at DESC")),
+        # Workspace view: WHERE workspace_id = ? AND is_archived = false ORDER BY last_message_at DESC
+        Index(
+            "ix_threads_workspace_active_recent",
+            "workspace_id", "is_archived", text("last_message_at DESC"),
+        ),
+    )
+    id: Optional[uuid.UUID] = Field(default_factory=uuid7, primary_key=True)
+
+    # Not loaded by default (refresh() would otherwise re-fetch the whole
+    # history each chat turn). Callers that walk messages opt in with
+    # .options(selectinload(ThreadModel.messages)): one `WHERE thread_id IN (...)`
+    # query instead of a joined load repeating the thread row per message.
+    messages: List["MessageModel"] = Relationship(
+        back_populates="thread",
+        sa_relationship_kwargs={
+            "lazy": RELATIONSHIP_LAZY,
+            "order_by": "MessageModel.created_at",
+            "primaryjoin": "ThreadModel.id == foreign(MessageModel.thread_id)",
+        },
+    )
@@ -2,9 +2,11 @@
 from datetime import datetime
 from typing import ClassVar, List, Optional
 import uuid
+from sqlalchemy import Index, func, text
+from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.orm import Mapped
-from pydantic import EmailStr
 from sqlmodel import (
+    AutoString,
     Column,
     DateTime,
     Field,
@@ -14,7 +16,10 @@ from sqlmodel import (
     UniqueConstraint,
 )
 
+from app.schemas.user_schema import DBEmail
 from app.utils.datetime_utils import utc_now
+from app.utils.orm_utils import RELATIONSHIP_LAZY
+from app.utils.uuid_utils import uuid7
 
 
 class UserBase(SQLModel):
@@ -23,7 +28,8 @@ class UserBase(SQLModel):
         default=None, index=True, unique=True, max_length=50, nullable=True
     ) 
     
-    email: EmailStr = Field(index=True, unique=True, nullable=False)
+    # Uniqueness is case-insensitive: see uq_users_email_lower on UserModel.
+    email: DBEmail = Field(nullable=False, sa_type=AutoString)
     
     hashed_password: Optional[str] = Field(default=None, nullable=True) 
     
@@ -36,14 +42,18 @@ class UserBase(SQLModel):
     
     updated_at: datetime = Field(
         default_factory=utc_now,
-        sa_column=Column(DateTime(timezone=True), index=True)
+        sa_column=Column(DateTime(timezone=True), index=True, onupdate=utc_now)
     )
 
 
 class UserModel(UserBase, table=True):
     """Database model for users."""
     __tablename__: ClassVar[str] = "users" 
-    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
+    __table_args__ = (
+        # Lookups go through lower(email) = lower(:email), see UserCRUD.get_user_by_email
+        Index("uq_users_email_lower", func.lower(text("email")), unique=True),
+    )
+    id: Optional[uuid.UUID] = Field(default_factory=uuid7, primary_key=True)
 
     linked_accounts: Mapped[List["LinkedAccountModel"]] = Relationship(
         back_populates="user",
@@ -55,11 +65,13 @@ class LinkedAccountModel(SQLModel, table=True):
     """Database model for linking external OAuth provider accounts to a user."""
     __tablename__: ClassVar[str] = "linked_accounts"    
     
-    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[uuid.UUID] = Field(default_factory=uuid7, primary_key=True)
     
     user_id: uuid.UUID = Field(
         sa_column=Column(
-            ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+            pg.UUID(as_uuid=True),
+            ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
         )
     )
     
@@ -73,13 +85,19 @@ class LinkedAccountModel(SQLModel, table=True):
     
     updated_at: datetime = Field(
         default_factory=utc_now,
-        sa_column=Column(DateTime(timezone=True), index=True)
+        sa_column=Column(DateTime(timezone=True), index=True, onupdate=utc_now)
     )
 
-    user: Mapped[UserModel | None] = Relationship(back_populates="linked_accounts")
+    user: Mapped[UserModel | None] = Relationship(
+        back_populates="linked_accounts",
+        sa_relationship_kwargs={"lazy": RELATIONSHIP_LAZY}
+    )
 
     __table_args__ = (
         UniqueConstraint("provider", "provider_key", name="uq_provider_provider_key"),
+        # Leading user_id serves the ON DELETE CASCADE lookup; provider covers
+        # "does this user have a <provider> account" without a second index.
+        Index("ix_linked_user_provider", "user_id", "provider"),
         # Consider a unique constraint on user_id and provider if a user can only link one account per provider
         # UniqueConstraint("user_id", "provider", name="uq_user_provider"),
     )
@@ -0,0 +1,26 @@
+"""Shared field validators for request schemas."""
+
+# Byte -> class bit: 1 = lowercase a-z, 2 = uppercase A-Z, 4 = digit 0-9.
+_ASCII_CLASS = bytes(
+    1 if 0x61 <= c <= 0x7A else 2 if 0x41 <= c <= 0x5A else 4 if 0x30 <= c <= 0x39 else 0
+    for c in range(256)
+)
+_ALL_CLASSES = 7
+
+
+def is_strong_password(value: str) -> bool:
+    """
+    Check the password rules in a single pass over the string:
+    - 8-128 characters, no newline
+    - at least one uppercase letter (A-Z)
+    - at least one lowercase letter (a-z)
+    - at least one digit (0-9)
+    """
+    if not 8 <= len(value) <= 128 or "\n" in value:
+        return False
+    acc = 0
+    for c in value.encode("utf-8", "ignore"):
+        acc |= _ASCII_CLASS[c]
+        if acc == _ALL_CLASSES:
+            return True
+    return False
@@ -2,7 +2,9 @@
 from enum import Enum
 from typing import Optional # Added Optional for type hinting consistency
 
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
+
+from app.schemas.user_schema import DBEmail
 
 
 class AuthProvider(str, Enum):
@@ -17,6 +19,8 @@ class NextAuthSigninPayload(BaseModel):
     Payload received from NextAuth callback.
     Contains token based on the provider.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     provider: AuthProvider
     id_token: Optional[str] = None      # Provided by Google, Microsoft (Azure AD)
     access_token: Optional[str] = None  # Provided by GitHub, and sometimes others
@@ -24,8 +28,10 @@ class NextAuthSigninPayload(BaseModel):
 
 class VerifiedUserData(BaseModel):
     """Standardized user info extracted after successful verification with an OAuth provider."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     provider: AuthProvider
     provider_key: str  # Unique user ID from the provider (e.g., Google sub, GitHub id, MS oid)
-    email: Optional[EmailStr] = None
+    email: Optional[DBEmail] = None  # Already verified by the provider
     name: Optional[str] = None
     picture: Optional[HttpUrl] = None
@@ -1,24 +1,42 @@
 """Pydantic schemas for chat message requests and responses."""
 import secrets
-from typing import List, Optional, Tuple
-from pydantic import BaseModel, Field
+from threading import Lock
+from typing import Annotated, List, Optional, Tuple
+import uuid
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 import time
 
-from app.models.message_model import MessageRole
+from app.models.message_model import MessageBase, MessageRole
+from app.schemas.thread_schema import ContentMetadata
+
+_last_message_ts = 0
+# gen_message_id cũng chạy trong threadpool: đọc-ghi timestamp phải nguyên tử.
+_message_ts_lock = Lock()
 
 def gen_message_id() -> str:
-    """Tạo ID tin nhắn duy nhất dựa trên timestamp và hex."""
-    timestamp = int(time.time() * 1e6)  # microseconds for higher uniqueness
-    hex_part = secrets.token_hex(8)
-    return f"{timestamp:x}-{hex_part}"
+    """Tạo ID tin nhắn duy nhất, sắp xếp được theo thời gian (timestamp µs + hex).
+
+    Timestamp không bao giờ lùi kể cả khi đồng hồ bị NTP chỉnh ngược,
+    nên `ORDER BY message_id` vẫn theo thứ tự tạo.
+    """
+    global _last_message_ts  # pylint: disable=global-statement
+    with _message_ts_lock:
+        timestamp = max(time.time_ns() // 1000, _last_message_ts + 1)
+        _last_message_ts = timestamp
+    return f"{timestamp:013x}-{secrets.token_hex(4)}"
+
+# Chỉ strip các ID; nội dung chat giữ nguyên khoảng trắng (thụt lề code, xuống dòng).
+_StrippedId = Annotated[str, StringConstraints(strip_whitespace=True)]
 
 class Messsage(BaseModel):
-    message_id: Optional[str] = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    message_id: Optional[_StrippedId] = Field(
         description="Unique identifier for the message, generated if not provided.",
         min_length=16,
     )
     content: str = Field(..., description="The content of the message.", min_length=2)
-    thread_id: Optional[str] = Field(None, description="Optional thread ID for the conversation.")
+    thread_id: Optional[_StrippedId] = Field(None, description="Optional thread ID for the conversation.")
     
 class MessageCreateRequest(Messsage):
     role: MessageRole = Field(
@@ -26,6 +44,10 @@ class MessageCreateRequest(Messsage):
         description="The role of the message sender, default is USER."
     )
 
+# Giữ dạng tuple: pydantic-core validate tuple nhanh hơn ~3x so với NamedTuple
+# hay model con, và wire format vẫn là mảng `[role, content]`.
+HistoryTurn = Tuple[MessageRole, str]
+
 class MessageRequest(BaseModel):
     """
     Schema for AI chat request.
@@ -34,15 +56,17 @@ class MessageRequest(BaseModel):
         ...,
         description="The message content and metadata for the AI chat request."
     )
-    history: List[Tuple[MessageRole, str]] = Field(
+    history: List[HistoryTurn] = Field(
         default_factory=list,
         description="A list of previous messages in the conversation, alternating user/AI."
     )
     system_instructions: Optional[str] = Field(None, description="Optional system instructions for the AI.")
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        use_enum_values=True,
         # Example for the schema
-        json_schema_extra = {
+        json_schema_extra={
             "example": {
                 "message": {
                     "message_id": gen_message_id(),
@@ -55,4 +79,14 @@ class MessageRequest(BaseModel):
                 ],
                 "system_instructions": "Hãy trả lời một cách thân thiện và chuyên nghiệp.",
             }
-        }
+        },
+    )
+
+
+class MessageResponse(MessageBase):
+    """
+    Message as returned by the API. `id` is the public UUID (`public_id`);
+    the internal bigint key of MessageModel is never sent to clients.
+    """
+    id: uuid.UUID = Field(validation_alias="public_id")
+    msg_metadata: Optional[ContentMetadata] = None
@@ -1,8 +1,9 @@
-from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, List, Optional
+from pydantic import AwareDatetime, BaseModel, ConfigDict
 
 class ThreadResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: int
     title: str
     content: str
@@ -12,12 +13,14 @@ class ThreadsResponse(BaseModel):
     
 
 class CreateThreadRequestSchema(BaseModel):
-    last_message_at: datetime
+    last_message_at: AwareDatetime
     
 class CreateThreadResponseSchema(BaseModel):
     """
     Schema Pydantic cho phản hồi tạo chủ đề.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     thread_id: str
     
 class Usage(BaseModel):
@@ -32,10 +35,12 @@ class Step(BaseModel):
     usage: Optional[Usage] = None
 
 class ContentMetadata(BaseModel):
-    unstable_annotations: List[Any] | None = None
-    unstable_data: List[Any] | None = None
+    # Opaque client payloads: the server never inspects them, so pass them
+    # through as-is instead of walking every element on validate.
+    unstable_annotations: Any = None
+    unstable_data: Any = None
     steps: List[Step] | None = None
-    custom: Dict[str, Any] | None = None
+    custom: Any = None
 
 class CreateThreadRequest(BaseModel):
     title: Optional[str] = None
@@ -1,11 +1,19 @@
 """Pydantic models (schemas) for user-related data validation and serialization."""
-import re
+from dataclasses import dataclass
 from typing import Annotated, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, field_validator
 from sqlmodel import SQLModel
 
+from app.schemas._validators import is_strong_password
+
+# Email already validated on the way in (or issued by us); only a cheap shape
+# check instead of a full email_validator pass. Use EmailStr for inbound DTOs.
+DBEmail = Annotated[
+    str, StringConstraints(max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+]
+
 class UserCreate(SQLModel):
     """
     User registration schema.
@@ -24,16 +32,7 @@ class UserCreate(SQLModel):
         - At least one normal letter (a-z) # Corrected from A-Z
         - At least one digit (0-9)
         """
-        # Regex combines conditions:
-        # ^               : Start of string
-        # (?=.*[A-Z])     : Positive lookahead - Ensures at least 1 uppercase letter
-        # (?=.*[a-z])     : Positive lookahead - Ensures at least 1 lowercase letter
-        # (?=.*\d)        : Positive lookahead - Ensures at least 1 digit
-        # .{8,128}        : Matches any character (except newline) 8 to 128 times
-        # $               : End of string
-        password_regex = r"^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,128}$"
-
-        if not re.match(password_regex, value):
+        if not is_strong_password(value):
             raise ValueError(
                 "Password must be 8-128 characters long, including at least "
                 "one uppercase letter, one lowercase letter, and one number."
@@ -45,7 +44,8 @@ class UserLogin(BaseModel):
     """
     User login schema.
     """
-    email: EmailStr
+    # Only looked up, never stored: a shape check is enough, skip email_validator.
+    email: DBEmail
     password: str = Field(..., min_length=8, max_length=128)
 
     @field_validator("password")
@@ -56,8 +56,7 @@ class UserLogin(BaseModel):
         Ensures the password format matches the registration requirements.
         """
         # Reusing the same robust password validation logic
-        password_regex = r"^(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,128}$"
-        if not re.match(password_regex, value):
+        if not is_strong_password(value):
             # For login, a generic message might be better for security
             # to avoid revealing which part of the validation failed.
             # However, for consistency with UserCreate, keeping detailed for now.
@@ -69,9 +68,11 @@ class UserLogin(BaseModel):
 
 class UserBase(SQLModel):
     """Base user schema with core user information."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: UUID
     username: str
-    email: EmailStr 
+    email: DBEmail
     is_active: bool
     
 
@@ -85,9 +86,11 @@ class UserLoginResponse(BaseModel):
 
 class UserLoggedIn(SQLModel):
     """Schema representing the data of a currently logged-in user, typically from a token."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: UUID
     username: str
-    email: EmailStr 
+    email: DBEmail
 
 
 class GoogleTokenData(BaseModel):
@@ -95,14 +98,18 @@ class GoogleTokenData(BaseModel):
     google_id_token: str
 
 
-class TokenPayload(BaseModel):
+# Server-generated values: plain slotted dataclasses, no validation round-trip.
+# FastAPI still documents and serializes them when used as a response_model.
+@dataclass(frozen=True, slots=True)
+class TokenPayload:
     """Payload data contained within our application's JWT."""
-    sub: str 
+    sub: str
     username: Optional[str] = None
-    email: Optional[EmailStr] = None   
+    email: Optional[str] = None
 
 
-class TokenResponse(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TokenResponse:
     """Response model containing the FastAPI access token."""
     access_token: str
     token_type: str = "bearer"
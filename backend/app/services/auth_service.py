@@ -1,17 +1,85 @@
 """Authentication service to handle user authorization."""
+import hashlib
+import logging
+from threading import Lock
+import time
 from typing import Optional
 import uuid
 from fastapi import HTTPException, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
+from cachetools import TTLCache
 
 from app.core.security import decode_token
 # Assuming UserLoggedIn is defined in auth_schemas, adjust if necessary
 from app.schemas.user_schema import UserLoggedIn
 
+logger = logging.getLogger(__name__)
+
+# Built once at import and shared by every request.
+_BEARER = HTTPBearer()
+_OPTIONAL_BEARER = HTTPBearer(auto_error=False)
+
+
+# Authenticated users keyed by a token hash (never the raw credential). Entries
+# live at most _USER_TTL seconds and never past the token's own `exp`.
+_USER_TTL = 30
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_USER_TTL)
+_user_cache_lock = Lock()
+
+
+class _MissingClaimError(jwt.InvalidTokenError):
+    """A verified token lacks (or has an empty/invalid) claim needed to build UserLoggedIn."""
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _get_user(token: str) -> UserLoggedIn:
+    """
+    Return the UserLoggedIn for `token`. Tokens seen in the last few seconds
+    skip signature verification, UUID parsing and model construction; the
+    cached instance is frozen, so it is shared as-is. Failures are never cached.
+
+    Raises:
+        jwt.ExpiredSignatureError: If the token has expired.
+        _MissingClaimError: If sub, username or email is missing, empty or invalid.
+        jwt.PyJWTError: If the token is otherwise invalid.
+    """
+    key = _token_key(token)
+    now = time.time()
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+
+    payload = decode_token(token)
+    user_id: Optional[str] = payload.get("sub")
+    if not user_id:
+        raise _MissingClaimError("Invalid user ID in token")
+    username: Optional[str] = payload.get("username")
+    if not username:
+        raise _MissingClaimError("Invalid username in token")
+    email: Optional[str] = payload.get("email")
+    if not email:
+        raise _MissingClaimError("Invalid email in token")
+
+    try:
+        user = UserLoggedIn(id=uuid.UUID(user_id), username=username, email=email)
+    except ValueError as e:  # malformed sub, or claims failing UserLoggedIn validation
+        raise _MissingClaimError("Invalid user claims in token") from e
+    expires_at = now + _USER_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        expires_at = min(expires_at, exp)
+    with _user_cache_lock:
+        _user_cache[key] = (user, expires_at)
+    return user
+
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Security(HTTPBearer())
+    credentials: HTTPAuthorizationCredentials = Security(_BEARER)
 ) -> UserLoggedIn:
     """
     Decodes the JWT token from the Authorization header and returns the logged-in user.
@@ -26,36 +94,25 @@ async def get_current_user(
         UserLoggedIn: An object containing the authenticated user's details.
     """
     try:
-        # It's generally better to use a logger here instead of print for production code
-        print(f"Token: {credentials.credentials}")
-        payload = decode_token(credentials.credentials)
-        user_id: Optional[str] = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Invalid user ID in token")
-
-        username: Optional[str] = payload.get("username")
-        if username is None:
-            raise HTTPException(status_code=401, detail="Invalid username in token")
-
-        email: Optional[str] = payload.get("email")
-        if email is None:
-            raise HTTPException(status_code=401, detail="Invalid email in token")
-
-        return UserLoggedIn(id=uuid.UUID(user_id), username=username, email=email)
+        return _get_user(credentials.credentials)
     except jwt.ExpiredSignatureError as e:
         raise HTTPException(status_code=401, detail="Token has expired") from e
+    except _MissingClaimError as e:
+        raise HTTPException(status_code=401, detail=str(e)) from e
     except jwt.PyJWTError as e: # Catch other JWT errors
         raise HTTPException(status_code=401, detail="Invalid token credentials") from e
     except Exception as e:
+        # Log the cause server-side; never echo exception text to the client.
+        logger.exception("Unexpected error during authentication")
         raise HTTPException(
             status_code=500,
-            detail=f"Internal server error during authentication: {str(e)}"
+            detail="Internal server error during authentication"
         ) from e
 
 async def get_optional_current_user(
     # Sử dụng optional_http_bearer.
     # auth sẽ là None nếu không có header "Authorization" hoặc header không đúng định dạng Bearer.
-    auth: Optional[HTTPAuthorizationCredentials] = Security(HTTPBearer(auto_error=False))
+    auth: Optional[HTTPAuthorizationCredentials] = Security(_OPTIONAL_BEARER)
 ) -> Optional[UserLoggedIn]: # Kiểu trả về bây giờ là Optional[UserLoggedIn]
     """
     Optionally decodes the JWT token from the Authorization header.
@@ -77,19 +134,9 @@ async def get_optional_current_user(
     token = auth.credentials
     try:
         # print(f"Attempting to decode token: {token[:20]}...") # Để gỡ lỗi, chỉ hiển thị một phần token
-        payload = decode_token(token) # Hàm này nên raise jwt.ExpiredSignatureError hoặc jwt.PyJWTError nếu token có vấn đề
-
-        user_id: Optional[str] = payload.get("sub")
-        username: Optional[str] = payload.get("username")
-        email: Optional[str] = payload.get("email")
-
-        if not user_id or not username or not email:
-            # Nếu một trong các trường bắt buộc bị thiếu trong payload,
-            # coi như token không hợp lệ cho mục đích này.
-            # print("Token payload is missing required fields (sub, username, or email).") # Để gỡ lỗi
-            return None # Trả về None thay vì raise HTTPException
-
-        return UserLoggedIn(id=uuid.UUID(user_id), username=username, email=email)
+        # Hàm này raise jwt.ExpiredSignatureError hoặc jwt.PyJWTError nếu token có vấn đề
+        # Thiếu sub/username/email -> _MissingClaimError (một PyJWTError) -> trả về None
+        return _get_user(token)
 
     except jwt.ExpiredSignatureError:
         # Token đã hết hạn
@@ -101,12 +148,12 @@ async def get_optional_current_user(
         return None # Trả về None
     except Exception as e:
         # Ghi log lỗi này cho mục đích gỡ lỗi vì đây là lỗi không mong muốn
-        # logger.error(f"An unexpected error occurred during optional token decoding: {e}", exc_info=True)
-        # print(f"An unexpected server error occurred during authentication: {str(e)}") # Để gỡ lỗi
+        logger.exception("Unexpected error during optional token decoding")
 
         # Đối với các lỗi máy chủ không mong muốn khác xảy ra trong quá trình xác thực,
         # việc raise lỗi 500 vẫn hợp lý để thông báo về sự cố ở phía máy chủ.
+        # Không đưa nội dung exception vào detail trả về cho client.
         raise HTTPException(
             status_code=500,
-            detail=f"Internal server error during optional authentication: {str(e)}"
+            detail="Internal server error during optional authentication"
         ) from e
\ No newline at end of file
@@ -1,25 +1,156 @@
 """
 Authentication utility functions for verifying tokens from various providers.
 """
-from typing import Dict, Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Tuple
+import asyncio
 import base64
+import hashlib
 import logging
+import time
+from cachetools import TTLCache
 import httpx
 from fastapi import HTTPException, status
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
 import jwt
+import orjson
 from cryptography.hazmat.primitives.asymmetric import rsa
 from app.config.settings import settings
 from app.schemas.auth_schemas import AuthProvider, NextAuthSigninPayload, VerifiedUserData
+from app.utils.uuid_utils import is_valid_uuid
 
 logger = logging.getLogger(__name__)
 
+# Shared client so calls to the IdPs reuse pooled keep-alive connections (no
+# TCP/TLS handshake per sign-in). Created lazily, closed by close_http_client()
+# on shutdown and recreated on next use (e.g. across app restarts in tests).
+_http_client: httpx.AsyncClient | None = None
+# Tight bounds so a degraded IdP fails the sign-in quickly instead of parking it.
+_IDP_TIMEOUT = httpx.Timeout(connect=2.0, read=3.0, write=3.0, pool=2.0)
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared IdP HTTP client, creating it if needed."""
+    global _http_client  # pylint: disable=global-statement
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=_IDP_TIMEOUT,
+            # retries only re-attempt failed connects, never a sent request.
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+                ),
+            ),
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared IdP HTTP client."""
+    global _http_client  # pylint: disable=global-statement
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+class _KeyedLocks:
+    """
+    One asyncio.Lock per key, shared by every coroutine holding or waiting on it.
+    An entry is dropped once its last user leaves, so the map only holds keys
+    with a fetch in flight and bogus kids cannot grow it.
+    """
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, List] = {}  # key -> [lock, holders + waiters]
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[None]:
+        """Acquire the lock for `key`, creating it on first use."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._entries[key]
+
+_GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+_GOOGLE_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+# kid -> RSAPublicKey. Google rotates its keys roughly daily and publishes them well ahead.
+_google_public_key_cache: TTLCache = TTLCache(maxsize=64, ttl=3600)
+_google_missing_kid_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_google_kid_locks = _KeyedLocks()
+
+async def get_google_public_key(kid: str) -> rsa.RSAPublicKey:
+    """
+    Returns Google's RSA signing key for `kid`, fetching the JWKS on a cache miss.
+    Concurrent misses for the same kid share a single fetch.
+    """
+    cached = _google_public_key_cache.get(kid)
+    if cached is not None:
+        return cached
+
+    async with _google_kid_locks.hold(kid):
+        return await _load_google_public_key(kid)
+
+async def _load_google_public_key(kid: str) -> rsa.RSAPublicKey:
+    """Cache-miss path of get_google_public_key; must run under the kid's lock."""
+    cached = _google_public_key_cache.get(kid)
+    if cached is not None:
+        return cached
+    if kid in _google_missing_kid_cache:
+        raise ValueError(f"Google signing key with kid '{kid}' not found (cached miss).")
+
+    try:
+        logger.info("Fetching Google JWKS from: %s", _GOOGLE_CERTS_URL)
+        jwks_response = await _get_http_client().get(_GOOGLE_CERTS_URL)
+        jwks_response.raise_for_status()
+        jwks = orjson.loads(jwks_response.content)
+    except httpx.HTTPError as e:
+        logger.error("Error fetching Google JWKS for kid %s: %s", kid, e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not fetch Google signing keys"
+        ) from e
+
+    # Cache every published key, not just the requested one: the next rotation
+    # is usually already listed.
+    public_key_obj = None
+    for key_data in jwks.get("keys", []):
+        key_kid = key_data.get("kid")
+        if not key_kid or key_data.get("kty") != "RSA":
+            continue
+        key = _construct_rsa_public_key_from_jwk_data(key_data, key_kid)
+        if key is None:
+            continue
+        _google_public_key_cache[key_kid] = key
+        if key_kid == kid:
+            public_key_obj = key
+
+    if public_key_obj is None:
+        _google_missing_kid_cache[kid] = True
+        raise ValueError(f"Google signing key with kid '{kid}' not found in JWKS.")
+    return public_key_obj
+
 async def verify_google_id_token(google_token: str) -> VerifiedUserData:
-    """Verifies a Google ID token and returns standardized user data."""
+    """
+    Verifies a Google ID token locally against Google's cached signing keys
+    and returns standardized user data.
+    """
     try:
-        idinfo = id_token.verify_oauth2_token(
-            google_token, google_requests.Request(), settings.GOOGLE_CLIENT_ID
+        kid = _peek_jws_header(google_token).get("kid")
+        if not kid:
+            raise ValueError("Missing 'kid' in token header")
+        public_key_obj = await get_google_public_key(kid)
+        idinfo = jwt.decode(
+            google_token,
+            key=public_key_obj,
+            algorithms=["RS256"],
+            audience=settings.GOOGLE_CLIENT_ID,
+            issuer=_GOOGLE_ISSUERS,
+            options={"require": ["exp", "aud", "iss", "sub"]},
         )
         return VerifiedUserData(
             provider=AuthProvider.GOOGLE,
@@ -28,12 +159,14 @@ async def verify_google_id_token(google_token: str) -> VerifiedUserData:
             name=idinfo.get('name'),
             picture=idinfo.get('picture')
         )
-    except ValueError as e:
-        logger.error("Google Token verification value error: %s", e)
+    except (jwt.InvalidTokenError, ValueError) as e:
+        logger.warning("Google Token verification value error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid Google token: {e}" # f-string in HTTPException detail is fine
         ) from e
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Unexpected error verifying Google token: %s", e, exc_info=True)
         raise HTTPException(
@@ -44,68 +177,124 @@ async def verify_google_id_token(google_token: str) -> VerifiedUserData:
 async def verify_github_access_token(github_access_token: str) -> VerifiedUserData:
     """Verifies a GitHub access token by fetching user info."""
     user_api_url = "https://api.github.com/user"
+    emails_api_url = "https://api.github.com/user/emails"
     headers = {"Authorization": f"Bearer {github_access_token}"}
-    async with httpx.AsyncClient() as client:
-        try:
-            user_response = await client.get(user_api_url, headers=headers)
-            if user_response.status_code == 401:
-                logger.warning("GitHub token is invalid or expired (401). Token: %s*****", github_access_token[:5])
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired GitHub token"
-                )
-            user_response.raise_for_status()
-            user_info = user_response.json()
-
-            primary_email = user_info.get('email')
-            # if not primary_email:
-            # logger.debug("Primary email not found directly for GitHub user %s, may need to query /user/emails", user_info.get('login'))
-            # ... logic to call /user/emails ...
-
-            return VerifiedUserData(
-                provider=AuthProvider.GITHUB,
-                provider_key=str(user_info['id']),
-                email=primary_email,
-                name=user_info.get('name'),
-                picture=user_info.get('avatar_url')
-            )
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                "GitHub API HTTP error: %s - %s. Token: %s*****",
-                e.response.status_code, e.response.text, github_access_token[:5]
-            )
+    try:
+        # /user only exposes a public email; fetch /user/emails alongside it so the
+        # fallback costs no extra round-trip.
+        client = _get_http_client()
+        user_response, emails_response = await asyncio.gather(
+            client.get(user_api_url, headers=headers),
+            client.get(emails_api_url, headers=headers),
+            return_exceptions=True,
+        )
+        if isinstance(user_response, BaseException):
+            raise user_response
+        if user_response.status_code == 401:
+            logger.warning("GitHub token is invalid or expired (401). Token: %s*****", github_access_token[:5])
             raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Error fetching GitHub user info: {e.response.status_code}"
-            ) from e
-        except Exception as e:
-            logger.error(
-                "Unexpected error fetching GitHub user info. Token: %s*****. Error: %s",
-                github_access_token[:5], e, exc_info=True
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired GitHub token"
             )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Unexpected error fetching GitHub user info"
-            ) from e
+        user_response.raise_for_status()
+        user_info = orjson.loads(user_response.content)
 
-def base64url_decode(input_str: str) -> bytes:
-    """Helper to decode base64url string."""
-    rem = len(input_str) % 4
-    if rem > 0:
-        input_str += '=' * (4 - rem)
-    return base64.urlsafe_b64decode(input_str)
+        primary_email = user_info.get('email') or _github_primary_email(emails_response)
+
+        return VerifiedUserData(
+            provider=AuthProvider.GITHUB,
+            provider_key=str(user_info['id']),
+            email=primary_email,
+            name=user_info.get('name'),
+            picture=user_info.get('avatar_url')
+        )
+    except HTTPException:
+        raise
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            "GitHub API HTTP error: %s - %s. Token: %s*****",
+            e.response.status_code, e.response.text, github_access_token[:5]
+        )
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Error fetching GitHub user info: {e.response.status_code}"
+        ) from e
+    except Exception as e:
+        logger.error(
+            "Unexpected error fetching GitHub user info. Token: %s*****. Error: %s",
+            github_access_token[:5], e, exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unexpected error fetching GitHub user info"
+        ) from e
 
-_microsoft_public_key_cache: Dict[str, Tuple[rsa.RSAPublicKey, str]] = {}
+def _github_primary_email(emails_response: httpx.Response | BaseException) -> str | None:
+    """
+    Primary verified address from /user/emails, or None when that optional call
+    failed (network error, the token lacks the user:email scope, or the body
+    is malformed).
+    """
+    if isinstance(emails_response, BaseException):
+        logger.warning("GitHub /user/emails request failed: %s", emails_response)
+        return None
+    if emails_response.status_code != 200:
+        return None
+    # Optional fallback: a malformed or unexpected body must never fail the sign-in.
+    try:
+        emails = orjson.loads(emails_response.content)
+        if not isinstance(emails, list):
+            raise TypeError(f"expected a list, got {type(emails).__name__}")
+        for entry in emails:
+            if isinstance(entry, dict) and entry.get('primary') and entry.get('verified'):
+                email = entry.get('email')
+                return email if isinstance(email, str) else None
+    except (orjson.JSONDecodeError, TypeError, KeyError) as e:
+        logger.warning("Unexpected GitHub /user/emails response: %s", e)
+    return None
+
+def base64url_decode(input_str: str) -> bytes:
+    """Helper to decode base64url string (unpadded input is fine: excess '=' is ignored)."""
+    return base64.urlsafe_b64decode(input_str + "===")
+
+# kid -> (RSAPublicKey, issuer). Bounded and expiring so rotated keys age out.
+_microsoft_public_key_cache: TTLCache = TTLCache(maxsize=256, ttl=3600)
+# kids recently looked up and not found in the JWKS; avoids refetching per request.
+_microsoft_missing_kid_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+# One in-flight OIDC/JWKS fetch per kid; other coroutines wait and reuse its result.
+_microsoft_kid_locks = _KeyedLocks()
+# tenant_id -> (jwks_uri, issuer). The discovery document is effectively static,
+# so a key rotation only re-pulls the JWKS.
+_microsoft_oidc_config_cache: TTLCache = TTLCache(maxsize=128, ttl=86400)
 
 # --- Helper functions for get_microsoft_public_key ---
+def _static_microsoft_oidc_config(tenant_id: str) -> Tuple[str, str] | None:
+    """
+    For a single tenant given by its GUID, jwks_uri and the v2.0 issuer are fixed
+    documented URLs, so no discovery fetch is needed. Returns None for "common",
+    "organizations" or domain-name tenants, whose issuer must come from discovery.
+    """
+    tenant = tenant_id.lower()
+    if not is_valid_uuid(tenant):
+        return None
+    base = f"https://login.microsoftonline.com/{tenant}"
+    return f"{base}/discovery/v2.0/keys", f"{base}/v2.0"
+
 async def _fetch_microsoft_oidc_config(
     client: httpx.AsyncClient, oidc_config_url: str, tenant_id: str
 ) -> Tuple[str, str]:
-    """Fetches OIDC config and returns jwks_uri and expected_issuer."""
+    """Fetches OIDC config (cached per tenant) and returns jwks_uri and expected_issuer."""
+    static = _static_microsoft_oidc_config(tenant_id)
+    if static is not None:
+        return static
+    cached = _microsoft_oidc_config_cache.get(tenant_id)
+    if cached is not None:
+        return cached
+
     logger.info("Fetching Microsoft OIDC config from: %s", oidc_config_url)
     oidc_response = await client.get(oidc_config_url)
     oidc_response.raise_for_status() # Let caller handle HTTPStatusError
-    oidc_config = oidc_response.json()
+    oidc_config = orjson.loads(oidc_response.content)
     jwks_uri = oidc_config.get("jwks_uri")
     expected_issuer = oidc_config.get("issuer")
     if not jwks_uri or not expected_issuer:
@@ -114,6 +303,7 @@ async def _fetch_microsoft_oidc_config(
             tenant_id, jwks_uri, expected_issuer
         )
         raise ValueError("Could not find JWKS URI or Issuer in OIDC config")
+    _microsoft_oidc_config_cache[tenant_id] = (jwks_uri, expected_issuer)
     return jwks_uri, expected_issuer
 
 async def _fetch_microsoft_jwks(client: httpx.AsyncClient, jwks_uri: str) -> Dict:
@@ -121,7 +311,7 @@ async def _fetch_microsoft_jwks(client: httpx.AsyncClient, jwks_uri: str) -> Dic
     logger.info("Fetching Microsoft JWKS from: %s", jwks_uri)
     jwks_response = await client.get(jwks_uri)
     jwks_response.raise_for_status() # Let caller handle HTTPStatusError
-    return jwks_response.json()
+    return orjson.loads(jwks_response.content)
 
 def _construct_rsa_public_key_from_jwk_data(key_dict: Dict, target_kid: str) -> rsa.RSAPublicKey | None:
     """Constructs an RSA public key from JWK data if 'n' and 'e' are present."""
@@ -150,32 +340,54 @@ async def get_microsoft_public_key(kid: str, tenant_id: str) -> Tuple[rsa.RSAPub
     and the expected issuer from the OIDC configuration. Caches the result.
     Returns a tuple (RSAPublicKey, expected_issuer).
     """
-    if kid in _microsoft_public_key_cache:
+    cached = _microsoft_public_key_cache.get(kid)
+    if cached is not None:
         logger.debug("Using cached public key for kid: %s", kid)
-        return _microsoft_public_key_cache[kid]
+        return cached
+
+    async with _microsoft_kid_locks.hold(kid):
+        return await _load_microsoft_public_key(kid, tenant_id)
+
+
+async def _load_microsoft_public_key(kid: str, tenant_id: str) -> Tuple[rsa.RSAPublicKey, str]:
+    """Cache-miss path of get_microsoft_public_key; must run under the kid's lock."""
+    # Re-check: another coroutine may have fetched this kid while we waited.
+    cached = _microsoft_public_key_cache.get(kid)
+    if cached is not None:
+        return cached
 
     oidc_config_url = f"https://login.microsoftonline.com/{tenant_id}/v2.0/.well-known/openid-configuration"
     public_key_obj: rsa.RSAPublicKey | None = None
     expected_issuer: str | None = None
 
     try:
-        async with httpx.AsyncClient() as client:
-            jwks_uri, expected_issuer = await _fetch_microsoft_oidc_config(client, oidc_config_url, tenant_id)
-            jwks = await _fetch_microsoft_jwks(client, jwks_uri)
-
-            for key_data in jwks.get("keys", []):
-                if key_data.get("kid") == kid and key_data.get("kty") == "RSA":
-                    public_key_obj = _construct_rsa_public_key_from_jwk_data(key_data, kid)
-                    if public_key_obj:
-                        break # Found and constructed key
-
-            if public_key_obj and expected_issuer:
-                _microsoft_public_key_cache[kid] = (public_key_obj, expected_issuer)
-                return public_key_obj, expected_issuer
-
-            # If key not found or issuer was missing (though helper should raise for issuer)
-            logger.error("RSA public key with kid '%s' not found in JWKS or expected issuer is missing.", kid)
-            raise ValueError(f"RSA public key with kid '{kid}' not found or issuer missing after OIDC/JWKS fetch.")
+        if kid in _microsoft_missing_kid_cache:
+            raise ValueError(f"RSA public key with kid '{kid}' not found (cached miss).")
+
+        client = _get_http_client()
+        jwks_uri, expected_issuer = await _fetch_microsoft_oidc_config(client, oidc_config_url, tenant_id)
+        jwks = await _fetch_microsoft_jwks(client, jwks_uri)
+
+        # Cache every published key in one pass so other kids (and the next
+        # rotation, which Microsoft publishes ahead of use) don't refetch.
+        for key_data in jwks.get("keys", []):
+            key_kid = key_data.get("kid")
+            if not key_kid or key_data.get("kty") != "RSA":
+                continue
+            key = _construct_rsa_public_key_from_jwk_data(key_data, key_kid)
+            if key is None:
+                continue
+            _microsoft_public_key_cache[key_kid] = (key, expected_issuer)
+            if key_kid == kid:
+                public_key_obj = key
+
+        if public_key_obj and expected_issuer:
+            return public_key_obj, expected_issuer
+
+        # If key not found or issuer was missing (though helper should raise for issuer)
+        _microsoft_missing_kid_cache[kid] = True
+        logger.error("RSA public key with kid '%s' not found in JWKS or expected issuer is missing.", kid)
+        raise ValueError(f"RSA public key with kid '{kid}' not found or issuer missing after OIDC/JWKS fetch.")
 
     except httpx.RequestError as e:
         logger.error("Network error fetching Microsoft OIDC/JWKS for tenant %s, kid %s: %s", tenant_id, kid, e)
@@ -194,8 +406,7 @@ async def get_microsoft_public_key(kid: str, tenant_id: str) -> Tuple[rsa.RSAPub
         ) from e
     except ValueError as e: # Catches ValueErrors from helpers or this function's logic
         logger.error("ValueError during Microsoft key retrieval for tenant %s, kid %s: %s", tenant_id, kid, e)
-        if kid in _microsoft_public_key_cache:
-            del _microsoft_public_key_cache[kid]
+        _microsoft_public_key_cache.pop(kid, None)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Invalid configuration or data for Microsoft signing keys: {e}"
@@ -205,41 +416,54 @@ async def get_microsoft_public_key(kid: str, tenant_id: str) -> Tuple[rsa.RSAPub
             "Unexpected error fetching/constructing Microsoft public key for tenant %s, kid %s: %s",
             tenant_id, kid, e, exc_info=True
         )
-        if kid in _microsoft_public_key_cache:
-            del _microsoft_public_key_cache[kid]
+        _microsoft_public_key_cache.pop(kid, None)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error processing Microsoft signing keys"
         ) from e
 
+def _peek_jws_header(token: str) -> Dict:
+    """
+    Decodes the (unverified) JWS header. Cheaper than jwt.get_unverified_header,
+    which runs PyJWT's full token parse; jwt.decode still verifies everything.
+    Raises ValueError on a malformed header.
+    """
+    header = orjson.loads(base64url_decode(token.split('.', 1)[0]))
+    if not isinstance(header, dict):
+        raise ValueError("Token header is not a JSON object")
+    return header
+
 # --- Helper for verify_microsoft_id_token ---
 def _parse_ms_token_header(ms_token: str) -> Tuple[str, str]:
     """Parses and validates 'kid' and 'alg' from token header."""
     try:
-        unverified_header = jwt.get_unverified_header(ms_token)
-    except jwt.DecodeError as e: # Handles cases where token is malformed and header can't be read
-        logger.error("Could not decode Microsoft token header: %s. Token: %s*****", e, ms_token[:20])
+        unverified_header = _peek_jws_header(ms_token)
+    except ValueError as e: # Handles cases where token is malformed and header can't be read
+        logger.warning("Could not decode Microsoft token header: %s. Token: %s*****", e, ms_token[:20])
         raise ValueError(f"Malformed token header: {e}") from e
 
     kid = unverified_header.get("kid")
     alg = unverified_header.get("alg")
     if not kid:
-        logger.error("Missing 'kid' in Microsoft token header. Token: %s*****", ms_token[:20])
+        logger.warning("Missing 'kid' in Microsoft token header. Token: %s*****", ms_token[:20])
         raise ValueError("Missing 'kid' in token header")
     if not alg or alg != "RS256":
-        logger.error("Unsupported algorithm '%s' in Microsoft token. Expected RS256. Kid: %s", alg, kid)
+        logger.warning("Unsupported algorithm '%s' in Microsoft token. Expected RS256. Kid: %s", alg, kid)
         raise ValueError(f"Unsupported algorithm: {alg}. Expected RS256.")
     return kid, alg
 # --- End of helper ---
 
-_JWT_ERROR_TO_HTTP_DETAIL = {
-    jwt.ExpiredSignatureError: "Microsoft token has expired",
-    jwt.InvalidAudienceError: "Invalid audience in Microsoft token",
-    jwt.InvalidIssuerError: "Invalid issuer in Microsoft token",
-}
+# sha256(token)[:16] -> (VerifiedUserData, exp). Only successes are cached; an
+# entry is never served past the token's own exp.
+_microsoft_result_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
 
 async def verify_microsoft_id_token(ms_token: str) -> VerifiedUserData:
     """Verifies Microsoft ID Token using PyJWT and returns standardized user info."""
+    token_key = hashlib.sha256(ms_token.encode()).digest()[:16]
+    hit = _microsoft_result_cache.get(token_key)
+    if hit is not None and hit[1] > time.time():
+        return hit[0]
+
     kid = None # Initialize kid to handle potential errors before it's set
     try:
         kid, _ = _parse_ms_token_header(ms_token) # alg from header not directly used after this
@@ -253,7 +477,8 @@ async def verify_microsoft_id_token(ms_token: str) -> VerifiedUserData:
             key=public_key_obj,
             algorithms=["RS256"],
             audience=settings.MICROSOFT_CLIENT_ID,
-            issuer=expected_issuer
+            issuer=expected_issuer,
+            options={"require": ["exp", "aud", "iss", "sub"]},
         )
 
         if settings.MICROSOFT_TENANT_ID != "common" and payload.get('tid') != settings.MICROSOFT_TENANT_ID:
@@ -266,23 +491,42 @@ async def verify_microsoft_id_token(ms_token: str) -> VerifiedUserData:
         logger.info("Microsoft token verified successfully for kid: %s, user: %s", kid, payload.get('sub'))
         # logger.debug("Token payload for kid %s: %s", kid, payload) # Uncomment if needed, be mindful of PII
 
-        return VerifiedUserData(
+        user_data = VerifiedUserData(
             provider=AuthProvider.MICROSOFT,
             provider_key=payload['sub'],
             email=payload.get('email') or payload.get('preferred_username'),
             name=payload.get('name'),
             picture=None
         )
-    except (jwt.ExpiredSignatureError, jwt.InvalidAudienceError, jwt.InvalidIssuerError) as e:
-        detail = _JWT_ERROR_TO_HTTP_DETAIL.get(type(e), "Invalid Microsoft token (unspecified JWT error)")
-        logger.warning("%s for kid %s: %s", detail, kid, e)
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail) from e
+        _microsoft_result_cache[token_key] = (user_data, payload['exp'])
+        return user_data
+    except jwt.ExpiredSignatureError as e:
+        logger.warning("Microsoft token has expired for kid %s: %s", kid, e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Microsoft token has expired"
+        ) from e
+    except jwt.InvalidAudienceError as e:
+        logger.warning("Invalid audience in Microsoft token for kid %s: %s", kid, e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid audience in Microsoft token"
+        ) from e
+    except jwt.InvalidIssuerError as e:
+        logger.warning("Invalid issuer in Microsoft token for kid %s: %s", kid, e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid issuer in Microsoft token"
+        ) from e
     except jwt.DecodeError as e: # Specific handling for DecodeError if not caught by _parse_ms_token_header
-        logger.error("Error decoding Microsoft token (PyJWT) for kid %s: %s", kid, e, exc_info=True)
+        logger.warning("Error decoding Microsoft token (PyJWT) for kid %s: %s", kid, e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid Microsoft token: Decode error - {e}"
         ) from e
+    except jwt.InvalidTokenError as e: # Missing required claims, not-yet-valid token, ...
+        logger.warning("Invalid Microsoft token for kid %s: %s", kid, e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid Microsoft token: {e}"
+        ) from e
     except jwt.PyJWKClientError as e: # Should not happen with manual key fetching but included for completeness
         logger.error("PyJWKClientError related error for kid %s: %s", kid, e, exc_info=True)
         raise HTTPException(
@@ -290,7 +534,7 @@ async def verify_microsoft_id_token(ms_token: str) -> VerifiedUserData:
             detail="Error related to JWK processing"
         ) from e
     except ValueError as e: # Catches ValueErrors from our logic (e.g., _parse_ms_token_header, tenant check)
-        logger.error("Microsoft Token verification value error for kid %s: %s", kid, e)
+        logger.warning("Microsoft Token verification value error for kid %s: %s", kid, e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid Microsoft token format or value: {e}"
@@ -299,8 +543,8 @@ async def verify_microsoft_id_token(ms_token: str) -> VerifiedUserData:
         raise e
     except Exception as e:
         logger.error("Unexpected error verifying Microsoft token for kid %s: %s", kid, e, exc_info=True)
-        if kid and kid in _microsoft_public_key_cache: # Clean cache on unexpected error
-            del _microsoft_public_key_cache[kid]
+        if kid: # Clean cache on unexpected error
+            _microsoft_public_key_cache.pop(kid, None)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal error verifying Microsoft token."
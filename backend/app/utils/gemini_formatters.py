@@ -2,7 +2,7 @@
 Module supporting the conversion of chat history to Google Gemini format.
 """
 
-import base64
+from binascii import a2b_base64
 from typing import List
 from google.genai.types import Content, Part
 from app.models.chat_model import Message, FileData
@@ -16,7 +16,7 @@ def handle_multimodal_data(file_data: FileData) -> Part:
     Returns:
         Part: A Google Gemini Part object containing the file data.
     """
-    data = base64.b64decode(file_data.data)  # decode base64 string to bytes
+    data = a2b_base64(file_data.data)  # decode base64 string to bytes (what b64decode wraps)
     return Part.from_bytes(data=data, mime_type=file_data.mime_type)
 
 def format_message_history_to_gemini_standard(
@@ -50,9 +50,7 @@ def format_message_history_to_gemini_standard(
             # Messages with files
             elif isinstance(message.content, list):
                 # Process each file in the list
-                parts = []
-                for file_data in message.content:
-                    parts.append(handle_multimodal_data(file_data))
+                parts = [handle_multimodal_data(file_data) for file_data in message.content]
 
                 # Add the parts to a Content object
                 if parts:
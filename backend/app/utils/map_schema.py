@@ -1,16 +1,26 @@
 # pylint: disable=C0103
 """Mapping utility for converting SQLModel instances to Pydantic schemas."""
 
+from functools import lru_cache
 from typing import TypeVar
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlmodel import SQLModel
 
 TSchema = TypeVar("TSchema", bound=BaseModel)
 TModel = TypeVar("TModel", bound=SQLModel)
 
 
-def map_models_schema(schema: BaseModel, models: list[TModel]):
+@lru_cache(maxsize=None)
+def _list_adapter(schema: type[TSchema]) -> TypeAdapter[list[TSchema]]:
+    """Build (once per schema) a validator for a whole list of that schema."""
+    return TypeAdapter(list[schema])
+
+
+def map_models_schema(schema: type[TSchema], models: list[TModel]) -> list[TSchema]:
     """
     Map SQLModel to Pydantic schema.
+
+    Validates the whole list through one compiled TypeAdapter instead of
+    calling model_validate per item.
     """
-    return [schema.model_validate(model) for model in models]
+    return _list_adapter(schema).validate_python(models, from_attributes=True)
@@ -0,0 +1,6 @@
+"""Shared SQLAlchemy ORM helpers for the model layer."""
+from app.config.settings import settings
+
+# Outside production, an unplanned lazy load raises instead of silently
+# issuing one query per row; call sites must use selectinload() explicitly.
+RELATIONSHIP_LAZY = "select" if settings.ENV == "prod" else "raise"
@@ -1,14 +1,62 @@
+import os
+import re
+import time
 import uuid
 
+_RANDOM_BATCH = 1024
+# Random tails for uuid7(), filled 1024 at a time so bursts of inserts make one
+# os.urandom() call instead of one per id. The timestamp is still read per id.
+_random_pool: list[int] = []
+# A forked worker must not hand out the same tails as its parent.
+os.register_at_fork(after_in_child=_random_pool.clear)
 
-def is_valid_uuid(uuid_to_test, version=4):
+
+def _next_random() -> int:
+    """Return 80 random bits from the pool, refilling it when empty."""
+    try:
+        return _random_pool.pop()
+    except IndexError:
+        buf = os.urandom(10 * _RANDOM_BATCH)
+        _random_pool.extend(
+            int.from_bytes(buf[i:i + 10], "big") for i in range(10, len(buf), 10)
+        )
+        return int.from_bytes(buf[:10], "big")
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562, section 5.7).
+
+    The top 48 bits hold the Unix timestamp in milliseconds, so ids created
+    later sort after earlier ones and B-tree inserts stay append-only.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = _next_random()
+    rand_a = rand >> 68                      # 12 bits
+    rand_b = rand & ((1 << 62) - 1)          # 62 bits
+    value = (
+        (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+# Canonical str(uuid.UUID) form: lowercase, hyphenated, no braces/urn prefix.
+_CANONICAL_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+def is_valid_uuid(uuid_to_test, version=None):
     """
     Check if uuid_to_test is a valid UUID.
+
+    Only the canonical form (what str(uuid.UUID) returns) is accepted. Passing a
+    version also requires that version nibble and the RFC 4122 variant, so leave
+    it as None to accept both legacy v4 ids and the v7 ids produced by uuid7().
     """
-    try:
-        uuid_obj = uuid.UUID(uuid_to_test.strip(), version=version)
-    except ValueError:
+    candidate = uuid_to_test.strip()
+    if _CANONICAL_UUID_RE.fullmatch(candidate) is None:
         return False
-
-    # return comparison
-    return str(uuid_obj) == uuid_to_test.strip()
\ No newline at end of file
+    if version is None:
+        return True
+    return candidate[14] == format(version, "x") and candidate[19] in "89ab"
@@ -0,0 +1,42 @@
+"""Messages server default timestamps
+
+Revision ID: 3f9c1d7a2b40
+Revises: e2a12075618a
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1d7a2b40'
+down_revision: Union[str, None] = 'e2a12075618a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('messages', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               nullable=False)
+    op.alter_column('messages', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('messages', 'updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=None,
+               nullable=True)
+    op.alter_column('messages', 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=None,
+               nullable=True)
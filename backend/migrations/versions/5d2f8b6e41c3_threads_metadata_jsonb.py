@@ -0,0 +1,37 @@
+"""Threads metadata jsonb
+
+Revision ID: 5d2f8b6e41c3
+Revises: c17b5e3f9a28
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8b6e41c3'
+down_revision: Union[str, None] = 'c17b5e3f9a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('threads', 'thread_metadata',
+                    existing_type=sa.JSON(),
+                    type_=postgresql.JSONB(),
+                    existing_nullable=True,
+                    postgresql_using='thread_metadata::jsonb')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('threads', 'thread_metadata',
+                    existing_type=postgresql.JSONB(),
+                    type_=sa.JSON(),
+                    existing_nullable=True,
+                    postgresql_using='thread_metadata::json')
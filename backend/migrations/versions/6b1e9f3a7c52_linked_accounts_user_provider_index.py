@@ -0,0 +1,30 @@
+"""Linked accounts (user_id, provider) index
+
+Revision ID: 6b1e9f3a7c52
+Revises: a94d07c6e215
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b1e9f3a7c52'
+down_revision: Union[str, None] = 'a94d07c6e215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_linked_user_provider', 'linked_accounts',
+                    ['user_id', 'provider'], unique=False)
+    op.drop_index('ix_linked_accounts_user_id', table_name='linked_accounts')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_linked_accounts_user_id', 'linked_accounts', ['user_id'], unique=False)
+    op.drop_index('ix_linked_user_provider', table_name='linked_accounts')
@@ -0,0 +1,37 @@
+"""Messages bigint surrogate pk
+
+Revision ID: 8a4e2c91d0b7
+Revises: 3f9c1d7a2b40
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4e2c91d0b7'
+down_revision: Union[str, None] = '3f9c1d7a2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('messages_pkey', 'messages', type_='primary')
+    op.alter_column('messages', 'id', new_column_name='public_id')
+    op.create_index(op.f('ix_messages_public_id'), 'messages', ['public_id'], unique=True)
+    op.execute('ALTER TABLE messages ADD COLUMN id BIGSERIAL NOT NULL')
+    op.create_primary_key('messages_pkey', 'messages', ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('messages_pkey', 'messages', type_='primary')
+    op.drop_column('messages', 'id')
+    op.drop_index(op.f('ix_messages_public_id'), table_name='messages')
+    op.alter_column('messages', 'public_id', new_column_name='id',
+               existing_type=sa.Uuid(), existing_nullable=False)
+    op.create_primary_key('messages_pkey', 'messages', ['id'])
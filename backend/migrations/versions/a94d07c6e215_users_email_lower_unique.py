@@ -0,0 +1,30 @@
+"""Users case-insensitive unique email
+
+Revision ID: a94d07c6e215
+Revises: 5d2f8b6e41c3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a94d07c6e215'
+down_revision: Union[str, None] = '5d2f8b6e41c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('uq_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    op.drop_index('ix_users_email', table_name='users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.drop_index('uq_users_email_lower', table_name='users')
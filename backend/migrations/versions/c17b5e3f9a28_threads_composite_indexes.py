@@ -0,0 +1,42 @@
+"""Threads composite indexes
+
+Revision ID: c17b5e3f9a28
+Revises: 8a4e2c91d0b7
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c17b5e3f9a28'
+down_revision: Union[str, None] = '8a4e2c91d0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_threads_created_at', table_name='threads')
+    op.drop_index('ix_threads_created_by', table_name='threads')
+    op.drop_index('ix_threads_updated_at', table_name='threads')
+    op.drop_index('ix_threads_is_archived', table_name='threads')
+    op.drop_index('ix_threads_workspace_id', table_name='threads')
+    op.create_index('ix_threads_created_by_recent', 'threads',
+                    ['created_by', sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_threads_workspace_active_recent', 'threads',
+                    ['workspace_id', 'is_archived', sa.text('last_message_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_threads_workspace_active_recent', table_name='threads')
+    op.drop_index('ix_threads_created_by_recent', table_name='threads')
+    op.create_index('ix_threads_workspace_id', 'threads', ['workspace_id'], unique=False)
+    op.create_index('ix_threads_is_archived', 'threads', ['is_archived'], unique=False)
+    op.create_index('ix_threads_updated_at', 'threads', ['updated_at'], unique=False)
+    op.create_index('ix_threads_created_by', 'threads', ['created_by'], unique=False)
+    op.create_index('ix_threads_created_at', 'threads', ['created_at'], unique=False)